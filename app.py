@@ -1,8 +1,12 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
+import json
 import logging
+import time
 
 from packages.core.llm.ai_tooling import AITooling
+from packages.core.inference.local_llama import local_backend_metrics
 from packages.core.agents.ai_orchestration import CrewAIOrchestrator
+from packages.core.ai_orchestration.core import AIAgentOrchestrationCore
 from packages.core.workflow.dynamic_workflow import DynamicWorkflowManager
 from packages.core.data.data_infrastructure import DataInfrastructure
 from app_components import start_app
@@ -10,21 +14,79 @@ from app_components import start_app
 app = Flask(__name__)
 logging.basicConfig(level=logging.INFO)
 
-# Initialize modules
+# Initialize modules. These are shared by every request thread and hold no per-request
+# state; anything specific to a run lives in the request's own session.
 ai_tooling = AITooling()
 orchestrator = CrewAIOrchestrator()
+orchestration_core = AIAgentOrchestrationCore()
 workflow_manager = DynamicWorkflowManager()
 data_infra = DataInfrastructure()
 
 
+def stream_format(data):
+    # Streaming is opt-in via {"stream": "ndjson" | "sse"} or an event-stream Accept header
+    mode = data.get('stream')
+    if mode is True:
+        mode = 'ndjson'
+    if not mode and request.accept_mimetypes.best == 'text/event-stream':
+        mode = 'sse'
+    return mode if mode in ('ndjson', 'sse') else None
+
+
+def stream_response(events, mode):
+    def generate():
+        try:
+            for event in events:
+                if mode == 'sse':
+                    yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+                else:
+                    yield json.dumps(event) + '\n'
+        finally:
+            # Propagate a client disconnect so the producer stops scheduling work
+            events.close()
+    mimetype = 'text/event-stream' if mode == 'sse' else 'application/x-ndjson'
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
+
+def result_events(results, **summary):
+    started = time.monotonic()
+    failed = 0
+    total = 0
+    for event in results:
+        total += 1
+        if event['result'].endswith('failed'):
+            failed += 1
+        result = {'type': 'result', 'task': event['task'], 'result': event['result']}
+        if 'stage' in event:
+            result['stage'] = event['stage']
+        yield result
+        yield {'type': 'progress', 'stage': event.get('stage'),
+               'completed': event['completed'], 'total': event['total']}
+    yield dict(summary, type='summary', total=total, succeeded=total - failed, failed=failed,
+               elapsed_seconds=round(time.monotonic() - started, 3))
+
+
+def run_orchestration(goal):
+    # Execution always goes through a fresh session, so concurrent runs stay isolated
+    session = orchestration_core.start_session(goal)
+    orchestration_core.decompose_goal(session)
+    orchestration_core.assign_specialized_agents(session)
+    return session
+
+
 @app.route('/api/ai_tooling', methods=['POST'])
 def ai_tooling_endpoint():
     data = request.get_json()
     prompt = data.get('prompt')
     if not prompt:
         return jsonify({'error': 'No prompt provided'}), 400
-    result = ai_tooling.process_prompt(prompt)
-    return jsonify({'result': result})
+    # Only client-supplied sessions get their own memory slot; anonymous calls share one
+    session_id = data.get('session_id')
+    result = ai_tooling.process_prompt(prompt, session_id=session_id)
+    response = {'result': result}
+    if session_id:
+        response['session_id'] = session_id
+    return jsonify(response)
 
 
 @app.route('/api/orchestrate', methods=['POST'])
@@ -33,8 +95,25 @@ def orchestrate_endpoint():
     goal = data.get('goal')
     if not goal:
         return jsonify({'error': 'No goal provided'}), 400
+    mode = stream_format(data)
+    # Streaming only changes how the response is delivered; whether tasks are executed
+    # is controlled separately by the "execute" flag
+    if data.get('execute'):
+        session = run_orchestration(goal)
+        if mode:
+            return stream_response(result_events(orchestration_core.stream_delegate_and_execute(session),
+                                                 session_id=session.session_id), mode)
+        results, dynamic_results = orchestration_core.delegate_and_execute(session)
+        return jsonify({'session_id': session.session_id, 'static_results': results,
+                        'dynamic_results': dynamic_results})
     tasks = orchestrator.decompose_goal(goal)
     assignments = orchestrator.assign_tasks(tasks)
+    if mode:
+        def events():
+            for task in tasks:
+                yield {'type': 'assignment', 'task': task, 'agent': assignments[task]}
+            yield {'type': 'summary', 'total': len(tasks)}
+        return stream_response(events(), mode)
     return jsonify({'tasks': tasks, 'assignments': assignments})
 
 
@@ -44,10 +123,24 @@ def workflow_endpoint():
     tasks = data.get('tasks')
     if not tasks:
         return jsonify({'error': 'No tasks provided'}), 400
+    mode = stream_format(data)
+    if mode:
+        return stream_response(result_events(workflow_manager.stream_workflow(tasks)), mode)
     results = workflow_manager.start_workflow(tasks)
     return jsonify({'results': results})
 
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics_endpoint():
+    return jsonify({
+        'coalescing': {
+            'ai_tooling': ai_tooling.single_flight.stats(),
+            'orchestrator': orchestrator.single_flight.stats()
+        },
+        'local_inference': local_backend_metrics()
+    })
+
+
 @app.route('/api/data', methods=['GET'])
 def data_endpoint():
     snowflake_status = data_infra.connect_snowflake()
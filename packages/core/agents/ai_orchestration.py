@@ -1,11 +1,15 @@
 import logging
 import requests
 
+from src.concurrency.single_flight import SingleFlight, normalize_key
+
 class CrewAIOrchestrator:
     def __init__(self, crewai_endpoint="https://api.crew.ai/decompose", autogen_endpoint="https://api.autogenstudio.ai/assign"):
         self.logger = logging.getLogger("CrewAIOrchestrator")
         self.crewai_endpoint = crewai_endpoint
         self.autogen_endpoint = autogen_endpoint
+        # Identical goals arriving concurrently share a single decomposition
+        self.single_flight = SingleFlight("CrewAIOrchestrator")
         self.logger.info("CrewAIOrchestrator initialized.")
 
     def decompose(self, goal: str):
@@ -14,6 +18,10 @@ class CrewAIOrchestrator:
         return [f"Task 1: Understand {goal}", f"Task 2: Plan for {goal}", f"Task 3: Execute {goal}"]
 
     def decompose_goal(self, goal: str):
+        # Hand each caller its own copy of the shared result
+        return list(self.single_flight.do(normalize_key(goal), self._decompose_goal, goal))
+
+    def _decompose_goal(self, goal: str):
         self.logger.info(f"Sending goal to CrewAI for decomposition: {goal}")
         # Simulate API call to CrewAI (in production, use requests.post with payload and proper error handling)
         tasks = [
@@ -1,29 +1,143 @@
 import logging
-from typing import List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
 
 class Task:
     def __init__(self, description: str):
         self.description = description
 
 class Agent:
-    def __init__(self, name: str):
+    def __init__(self, name: str, max_concurrency: int = 1):
         self.name = name
+        self.max_concurrency = max_concurrency
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.busy_seconds = 0.0
+        self.created_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._executor = None
 
     def execute_task(self, task: Task) -> bool:
         logging.info(f"Agent {self.name} executing task: {task.description}")
         # In production, real execution logic would be here
         return True
 
+    @property
+    def load(self) -> int:
+        # Tasks waiting for a slot plus tasks currently running on this agent
+        with self._lock:
+            return self.queued + self.running
+
+    def has_capacity(self) -> bool:
+        return self.load < self.max_concurrency
+
+    def submit(self, task: Task):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                    thread_name_prefix=self.name)
+            self.queued += 1
+        return self._executor.submit(self._run, task)
+
+    def _run(self, task: Task) -> bool:
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+        started = time.monotonic()
+        try:
+            return self.execute_task(task)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+                self.busy_seconds += time.monotonic() - started
+
+    def metrics(self) -> Dict[str, float]:
+        with self._lock:
+            elapsed = max(time.monotonic() - self.created_at, 1e-9)
+            return {
+                "queue_depth": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "max_concurrency": self.max_concurrency,
+                "utilization": self.busy_seconds / (elapsed * self.max_concurrency),
+            }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+class AgentPool:
+    def __init__(self, role: str, size: int = 1, max_concurrency: int = 1,
+                 overflow: Optional["AgentPool"] = None):
+        if size < 1:
+            raise ValueError(f"Agent pool '{role}' needs at least one worker, got {size}")
+        self.role = role
+        self.workers = [Agent(f"{role} #{i + 1}", max_concurrency) for i in range(size)]
+        self.overflow = overflow
+        self.overflowed = 0
+        # Pools that overflow into the same generalist pool share its lock, so selecting a
+        # worker and reserving its slot is atomic across every pool that can pick it
+        self.dispatch_lock = overflow.dispatch_lock if overflow is not None else threading.Lock()
+        self.logger = logging.getLogger("AgentPool")
+
+    def least_loaded(self) -> Agent:
+        return min(self.workers, key=lambda agent: agent.load)
+
+    def select_agent(self) -> Agent:
+        agent = self.least_loaded()
+        if agent.has_capacity() or self.overflow is None:
+            return agent
+        # Every worker in this pool is saturated; spill over to the generalist pool
+        # if it has a free slot or a shorter queue than our best worker.
+        candidate = self.overflow.least_loaded()
+        if candidate.has_capacity() or candidate.load < agent.load:
+            self.overflowed += 1
+            self.logger.info(f"Pool '{self.role}' saturated, overflowing to {candidate.name}")
+            return candidate
+        return agent
+
+    def dispatch(self, task: Task):
+        with self.dispatch_lock:
+            agent = self.select_agent()
+            # submit() counts the task as queued before the lock is released
+            return agent, agent.submit(task)
+
+    def metrics(self) -> Dict[str, object]:
+        workers = {agent.name: agent.metrics() for agent in self.workers}
+        return {
+            "workers": workers,
+            "queue_depth": sum(m["queue_depth"] for m in workers.values()),
+            "utilization": sum(m["utilization"] for m in workers.values()) / len(workers),
+            "overflowed": self.overflowed,
+        }
+
+    def shutdown(self):
+        for agent in self.workers:
+            agent.shutdown()
+
 class Orchestrator:
-    def __init__(self):
-        # Initialize specialized agents as defined in the blueprint
+    def __init__(self, pool_sizes: Optional[Dict[str, int]] = None, max_concurrency: int = 1,
+                 generalist_pool_size: int = 2):
+        pool_sizes = pool_sizes or {}
+        # Generalist workers absorb bursts that the specialized pools cannot take
+        self.generalists = AgentPool("Generalist", generalist_pool_size, max_concurrency)
+        # Initialize pools of specialized agents as defined in the blueprint
         self.agents = {
-            "campaign_strategist": Agent("Campaign Strategist"),
-            "compliance_guard": Agent("Compliance Guard"),
-            "toolsmith": Agent("Toolsmith")
+            key: AgentPool(role, pool_sizes.get(key, 1), max_concurrency, overflow=self.generalists)
+            for key, role in (
+                ("campaign_strategist", "Campaign Strategist"),
+                ("compliance_guard", "Compliance Guard"),
+                ("toolsmith", "Toolsmith"),
+            )
         }
         self.logger = logging.getLogger("Orchestrator")
-    
+
     def decompose_goal(self, goal: str) -> List[Task]:
         # In production, this would use GPT-Engineer to decompose the goal
         tasks = [
@@ -35,23 +149,40 @@ class Orchestrator:
         self.logger.info(f"Decomposed goal '{goal}' into tasks: {[t.description for t in tasks]}")
         return tasks
 
+    def route_task(self, idx: int) -> str:
+        if idx in [0, 1]:
+            return "campaign_strategist"
+        elif idx == 2:
+            return "toolsmith"
+        return "compliance_guard"
+
     def assign_tasks(self, goal: str):
         tasks = self.decompose_goal(goal)
         assignments = {}
+        futures = {}
         for idx, task in enumerate(tasks):
-            if idx in [0, 1]:
-                assignments[task.description] = self.agents["campaign_strategist"]
-            elif idx == 2:
-                assignments[task.description] = self.agents["toolsmith"]
-            elif idx == 3:
-                assignments[task.description] = self.agents["compliance_guard"]
-        for task_desc, agent in assignments.items():
-            result = agent.execute_task(Task(task_desc))
-            self.logger.info(f"Task '{task_desc}' executed by {agent.name} with result: {result}")
+            agent, future = self.agents[self.route_task(idx)].dispatch(task)
+            assignments[task.description] = agent
+            futures[future] = (task.description, agent)
+        wait(futures)
+        for future, (task_desc, agent) in futures.items():
+            self.logger.info(f"Task '{task_desc}' executed by {agent.name} with result: {future.result()}")
         return assignments
 
+    def metrics(self) -> Dict[str, object]:
+        pools = dict(self.agents)
+        pools["generalist"] = self.generalists
+        return {key: pool.metrics() for key, pool in pools.items()}
+
+    def shutdown(self):
+        for pool in self.agents.values():
+            pool.shutdown()
+        self.generalists.shutdown()
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
-    orchestrator = Orchestrator()
+    orchestrator = Orchestrator(pool_sizes={"campaign_strategist": 2})
     goal = "Increase email conversions for eco-friendly skincare"
-    orchestrator.assign_tasks(goal) 
\ No newline at end of file
+    orchestrator.assign_tasks(goal)
+    logging.info(f"Agent pool metrics: {orchestrator.metrics()}")
+    orchestrator.shutdown()
@@ -1,10 +1,19 @@
 import logging
 import random
+import uuid
 
 from src.agents.ai_orchestration import CrewAIOrchestrator
 from src.workflow.dynamic_workflow import DynamicWorkflowManager
 
 
+class OrchestrationSession:
+    # Per-run state, so concurrent orchestrations never share or overwrite each other's tasks
+    def __init__(self, goal: str):
+        self.session_id = str(uuid.uuid4())
+        self.goal = goal
+        self.tasks = []  # List of task dicts { 'task': str, 'priority': int, 'agent': str, 'status': str }
+
+
 class AIAgentOrchestrationCore:
     def __init__(self):
         self.logger = logging.getLogger("AIAgentOrchestrationCore")
@@ -12,7 +21,6 @@ class AIAgentOrchestrationCore:
         self.workflow_manager = DynamicWorkflowManager()
         self.zep_client = self.init_zep_client()  # For long-term memory storage
         self.guardrails = self.init_guardrails()   # For ethical oversight
-        self.tasks = []  # List of task dicts { 'task': str, 'priority': int, 'agent': str, 'status': str }
 
     def init_zep_client(self):
         self.logger.info("Initializing Zep client for long-term memory storage.")
@@ -24,18 +32,23 @@ class AIAgentOrchestrationCore:
         # Placeholder implementation for guardrails initialization
         return "GuardrailsStub"
 
-    def decompose_goal(self, goal: str):
-        self.logger.info(f"Decomposing goal: {goal}")
+    def start_session(self, goal: str) -> OrchestrationSession:
+        session = OrchestrationSession(goal)
+        self.logger.info(f"Started orchestration session {session.session_id} for goal: {goal}")
+        return session
+
+    def decompose_goal(self, session: OrchestrationSession):
+        self.logger.info(f"[{session.session_id}] Decomposing goal: {session.goal}")
         # Use CrewAIOrchestrator's decompose method
-        tasks = self.crew_ai.decompose(goal)
+        tasks = self.crew_ai.decompose(session.goal)
         # Initialize tasks with a default priority (e.g., 5) and pending status
-        self.tasks = [{ 'task': t, 'priority': 5, 'agent': None, 'status': 'pending' } for t in tasks]
-        self.logger.info(f"Initial tasks: {self.tasks}")
-        return self.tasks
+        session.tasks = [{ 'task': t, 'priority': 5, 'agent': None, 'status': 'pending' } for t in tasks]
+        self.logger.info(f"[{session.session_id}] Initial tasks: {session.tasks}")
+        return session.tasks
 
-    def assign_specialized_agents(self):
-        self.logger.info("Assigning specialized agents to tasks...")
-        for task in self.tasks:
+    def assign_specialized_agents(self, session: OrchestrationSession):
+        self.logger.info(f"[{session.session_id}] Assigning specialized agents to tasks...")
+        for task in session.tasks:
             # Simple simulated assignment based on task content
             if "Understand" in task['task']:
                 task['agent'] = "Campaign Strategist Agent"
@@ -45,16 +58,16 @@ class AIAgentOrchestrationCore:
                 task['agent'] = "Compliance Guard Agent"
             else:
                 task['agent'] = "Default Agent"
-        self.logger.info(f"Tasks after agent assignment: {self.tasks}")
-        return self.tasks
+        self.logger.info(f"[{session.session_id}] Tasks after agent assignment: {session.tasks}")
+        return session.tasks
 
-    def adjust_task_priority(self, task_identifier: str, new_priority: int):
-        self.logger.info(f"Adjusting priority for task containing '{task_identifier}' to {new_priority}")
-        for task in self.tasks:
+    def adjust_task_priority(self, session: OrchestrationSession, task_identifier: str, new_priority: int):
+        self.logger.info(f"[{session.session_id}] Adjusting priority for task containing '{task_identifier}' to {new_priority}")
+        for task in session.tasks:
             if task_identifier in task['task']:
                 task['priority'] = new_priority
-                self.logger.info(f"Updated task: {task}")
-        return self.tasks
+                self.logger.info(f"[{session.session_id}] Updated task: {task}")
+        return session.tasks
 
     def select_llm(self, task_text: str) -> str:
         self.logger.info(f"Selecting LLM for task: {task_text}")
@@ -64,31 +77,44 @@ class AIAgentOrchestrationCore:
         else:
             return "Azure AI (fallback)"
 
-    def delegate_and_execute(self):
-        self.logger.info("Delegating tasks to agents and executing workflow.")
-        # Sort tasks by priority (lower number indicates higher priority)
-        sorted_tasks = sorted(self.tasks, key=lambda x: x['priority'])
+    def delegate_and_execute(self, session: OrchestrationSession):
+        self.logger.info(f"[{session.session_id}] Delegating tasks to agents and executing workflow.")
         results = {}
+        dynamic_results = {}
+        for event in self.stream_delegate_and_execute(session):
+            if event['stage'] == 'static':
+                results[event['task']] = event['result']
+            else:
+                dynamic_results[event['task']] = event['result']
+        self.logger.info(f"[{session.session_id}] Task execution results: {results}")
+        self.logger.info(f"[{session.session_id}] Workflow execution finished with: {dynamic_results}")
+        return results, dynamic_results
+
+    def stream_delegate_and_execute(self, session: OrchestrationSession):
+        # Sort tasks by priority (lower number indicates higher priority)
+        sorted_tasks = sorted(session.tasks, key=lambda x: x['priority'])
+        processed = []
         for task in sorted_tasks:
-            self.logger.info(f"Delegating task: {task}")
+            self.logger.info(f"[{session.session_id}] Delegating task: {task}")
             llm = self.select_llm(task['task'])
             # Simulate processing of task with chosen LLM and assigned agent
             result = f"{task['task']} processed by {llm} via {task['agent']}"
-            results[task['task']] = result
+            processed.append(result)
             task['status'] = 'completed'
-        self.logger.info(f"Task execution results: {results}")
-        # Execute additional dynamic workflow if needed
-        dynamic_results = self.workflow_manager.start_workflow(list(results.values()))
-        self.logger.info(f"Workflow execution finished with: {dynamic_results}")
-        return results, dynamic_results
+            yield {'stage': 'static', 'task': task['task'], 'result': result,
+                   'completed': len(processed), 'total': len(sorted_tasks)}
+        # Execute additional dynamic workflow if needed, forwarding each result as it lands
+        for event in self.workflow_manager.stream_workflow(processed):
+            yield dict(event, stage='dynamic')
 
     def orchestrate(self, goal: str):
         self.logger.info(f"Starting orchestration for goal: {goal}")
-        self.decompose_goal(goal)
-        self.assign_specialized_agents()
+        session = self.start_session(goal)
+        self.decompose_goal(session)
+        self.assign_specialized_agents(session)
         # Simulate dynamic priority adjustments
-        for task in self.tasks:
+        for task in session.tasks:
             if random.choice([True, False]):
-                self.adjust_task_priority(task['task'], 3)
-        results, dynamic_results = self.delegate_and_execute()
-        return {'static_results': results, 'dynamic_results': dynamic_results} 
\ No newline at end of file
+                self.adjust_task_priority(session, task['task'], 3)
+        results, dynamic_results = self.delegate_and_execute(session)
+        return {'session_id': session.session_id, 'static_results': results, 'dynamic_results': dynamic_results} 
\ No newline at end of file
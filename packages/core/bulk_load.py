@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Bulk Load Stage for the ETL Pipeline
+
+Buffers records into size- or time-bounded batches and hands each batch to a pluggable sink
+on a pool of writer threads. Sinks borrow connections from a pool instead of opening one per
+write. SQLiteSink (multi-row inserts) and FileSink (staged batch files, as used by Snowflake
+COPY INTO) are local stand-ins for the Snowflake and Redpanda targets.
+"""
+
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+logger = logging.getLogger("BulkLoader")
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER on older builds
+SQLITE_MAX_VARIABLES = 999
+
+
+def quote_identifier(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class ConnectionPool:
+    def __init__(self, factory, size=4):
+        self.connections = queue.Queue()
+        for _ in range(size):
+            self.connections.put(factory())
+
+    @contextmanager
+    def connection(self):
+        conn = self.connections.get()
+        try:
+            yield conn
+        finally:
+            self.connections.put(conn)
+
+    def close(self):
+        while not self.connections.empty():
+            self.connections.get().close()
+
+
+class SQLiteSink:
+    def __init__(self, path, table="etl_records", pool_size=4):
+        self.table = table
+        self.pool = ConnectionPool(lambda: self._connect(path), pool_size)
+        self.columns = None
+        self.schema_lock = threading.Lock()
+
+    @staticmethod
+    def _connect(path):
+        conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def _ensure_columns(self, conn, columns):
+        # Make sure every column in the batch exists, adding new ones rather than dropping fields
+        table = quote_identifier(self.table)
+        with self.schema_lock:
+            if self.columns is None:
+                column_list = ", ".join(quote_identifier(c) for c in columns)
+                conn.execute(f'CREATE TABLE IF NOT EXISTS {table} ({column_list})')
+                # The table may predate this sink, so trust its real schema over our batch
+                self.columns = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+            missing = [c for c in columns if c not in self.columns]
+            for column in missing:
+                logger.info(f"Adding column {column} to {self.table}")
+                conn.execute(f'ALTER TABLE {table} ADD COLUMN {quote_identifier(column)}')
+                self.columns.add(column)
+            conn.commit()
+
+    def write_batch(self, records):
+        # Records in a batch may carry different keys; write the union and leave gaps NULL
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        if not columns:
+            raise ValueError(f"Cannot load records without fields into {self.table}")
+        with self.pool.connection() as conn:
+            self._ensure_columns(conn, columns)
+            rows_per_statement = max(1, SQLITE_MAX_VARIABLES // len(columns))
+            row_placeholder = "(" + ", ".join("?" for _ in columns) + ")"
+            column_list = ", ".join(quote_identifier(c) for c in columns)
+            with conn:
+                for start in range(0, len(records), rows_per_statement):
+                    chunk = records[start:start + rows_per_statement]
+                    values = [record.get(c) for record in chunk for c in columns]
+                    conn.execute(
+                        f'INSERT INTO {quote_identifier(self.table)} ({column_list}) VALUES '
+                        + ", ".join(row_placeholder for _ in chunk),
+                        values,
+                    )
+
+    def close(self):
+        self.pool.close()
+
+
+class FileSink:
+    def __init__(self, directory, prefix="batch"):
+        self.directory = directory
+        self.prefix = prefix
+        self.sequence = 0
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def write_batch(self, records):
+        with self.lock:
+            self.sequence += 1
+            sequence = self.sequence
+        path = os.path.join(self.directory, f"{self.prefix}-{sequence:06d}.jsonl")
+        # Write under a temporary name so a loader watching the stage never sees partial files
+        with open(path + ".tmp", "w") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+        os.replace(path + ".tmp", path)
+
+    def close(self):
+        pass
+
+
+class BulkLoader:
+    def __init__(self, sink, batch_size=500, flush_interval=1.0, workers=2):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-writer")
+        self.buffer = []
+        self.buffer_started = None
+        self.futures = []
+        self.lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.rows = 0
+        self.batch_latencies = []
+        self.started = time.monotonic()
+        # Flushes partial batches in slow or idle streams once they are flush_interval old
+        self.stopped = threading.Event()
+        self.flusher = threading.Thread(target=self._flush_periodically, name="bulk-flusher", daemon=True)
+        self.flusher.start()
+
+    def add(self, record):
+        with self.lock:
+            if not self.buffer:
+                self.buffer_started = time.monotonic()
+            self.buffer.append(record)
+            if (len(self.buffer) >= self.batch_size
+                    or time.monotonic() - self.buffer_started >= self.flush_interval):
+                self._flush_locked()
+
+    def flush(self):
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_periodically(self):
+        while not self.stopped.wait(self.flush_interval / 4):
+            with self.lock:
+                if self.buffer and time.monotonic() - self.buffer_started >= self.flush_interval:
+                    self._flush_locked()
+
+    def _flush_locked(self):
+        if self.buffer:
+            batch, self.buffer = self.buffer, []
+            self.futures.append(self.executor.submit(self._write, batch))
+
+    def _write(self, batch):
+        started = time.monotonic()
+        self.sink.write_batch(batch)
+        latency = time.monotonic() - started
+        with self.stats_lock:
+            self.rows += len(batch)
+            self.batch_latencies.append(latency)
+
+    def load(self, records):
+        for record in records:
+            self.add(record)
+        return self.close()
+
+    def close(self):
+        self.stopped.set()
+        self.flusher.join()
+        self.flush()
+        self.executor.shutdown(wait=True)
+        # Surface the first writer error, if any. The sink stays open: whoever created it
+        # decides whether it is reused for the next load.
+        for future in self.futures:
+            future.result()
+        return self.metrics()
+
+    def metrics(self):
+        with self.stats_lock:
+            latencies = sorted(self.batch_latencies)
+            rows = self.rows
+        elapsed = time.monotonic() - self.started
+        return {
+            "rows": rows,
+            "batches": len(latencies),
+            "rows_per_sec": rows / elapsed if elapsed > 0 else 0.0,
+            "batch_latency_avg_ms": 1000 * sum(latencies) / len(latencies) if latencies else 0.0,
+            "batch_latency_p95_ms": 1000 * latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0,
+            "batch_latency_max_ms": 1000 * latencies[-1] if latencies else 0.0,
+        }
@@ -0,0 +1,76 @@
+import logging
+import threading
+
+
+def normalize_key(text: str) -> str:
+    # Only outer whitespace is ignored: results depend on the exact text, including its case
+    return text.strip()
+
+
+class SingleFlightAborted(RuntimeError):
+    pass
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self, name: str, timeout: float = 30.0):
+        self.logger = logging.getLogger(f"SingleFlight[{name}]")
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.counters = {"requests": 0, "executions": 0, "coalesced": 0, "errors": 0, "timeouts": 0}
+
+    def do(self, key: str, fn, *args, **kwargs):
+        with self.lock:
+            self.counters["requests"] += 1
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self.calls[key] = call
+                self.counters["executions"] += 1
+            else:
+                self.counters["coalesced"] += 1
+        if not leader:
+            self.logger.info(f"Coalescing request onto in-flight computation for: {key}")
+            return self._wait(key, call)
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                call.error = e
+            else:
+                # KeyboardInterrupt/SystemExit belong to the leader's thread; followers get
+                # an ordinary error instead of a missing result
+                call.error = SingleFlightAborted(f"In-flight computation was aborted: {key}")
+                call.error.__cause__ = e
+            with self.lock:
+                self.counters["errors"] += 1
+            raise
+        finally:
+            # Forget the key before waking waiters so later requests start a fresh computation
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+        return call.result
+
+    def _wait(self, key: str, call: _Call):
+        if not call.done.wait(self.timeout):
+            with self.lock:
+                self.counters["timeouts"] += 1
+            raise TimeoutError(f"Timed out after {self.timeout}s waiting for in-flight computation: {key}")
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters)
+            stats["in_flight"] = len(self.calls)
+        return stats
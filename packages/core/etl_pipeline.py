@@ -1,4 +1,5 @@
 import logging
+import os
 
 # Import DataInfrastructure for potential integrations (dummy usage in this sample)
 from src.data.data_infrastructure import DataInfrastructure
@@ -6,6 +7,9 @@ from src.data.data_infrastructure import DataInfrastructure
 # Import send_event to integrate observability events
 from observability.monte_carlo_client import send_event
 
+# Pluggable bulk-load stage; SQLite stands in for Snowflake until the warehouse sink lands
+from src.bulk_load import BulkLoader, SQLiteSink
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ETLPipeline")
 
@@ -25,10 +29,19 @@ def transform(data):
     return transformed_data
 
 
-def load(data):
+def load(data, sink=None, batch_size=500, workers=2):
     logger.info("Loading data into target system...")
-    # Simulated loading operation; in a real scenario, load data into a system like Redpanda or Snowflake
-    logger.info("Data loaded successfully: %s", data)
+    # Callers running many ETL passes pass a long-lived sink to keep its connection pool warm
+    owns_sink = sink is None
+    if owns_sink:
+        sink = SQLiteSink(os.getenv("ETL_SQLITE_PATH", "etl_load.db"), pool_size=workers)
+    try:
+        metrics = BulkLoader(sink, batch_size=batch_size, workers=workers).load(data)
+    finally:
+        if owns_sink:
+            sink.close()
+    logger.info("Data loaded successfully: %s", metrics)
+    send_event("load_metrics", metrics)
     return True
 
 
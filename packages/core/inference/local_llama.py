@@ -0,0 +1,144 @@
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    from llama_cpp import Llama
+except ImportError:  # llama-cpp-python is only needed when a local model is configured
+    Llama = None
+
+
+# One backend per GGUF file per process, so every ModelInference shares the warm pool
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def local_backend_metrics():
+    with _backends_lock:
+        backends = list(_backends.values())
+    return {backend.model_path: backend.metrics() for backend in backends}
+
+
+def get_local_backend(model_path: str, **options):
+    key = os.path.abspath(model_path)
+    with _backends_lock:
+        backend = _backends.get(key)
+        if backend is None:
+            backend = LocalLlamaBackend(model_path, **options)
+            _backends[key] = backend
+        return backend
+
+
+class LocalLlamaBackend:
+    def __init__(self, model_path: str, pool_size: int = 2, n_ctx: int = 4096,
+                 n_threads: int = None, max_tokens: int = 256, max_cached_prefixes: int = 4):
+        self.logger = logging.getLogger("LocalLlamaBackend")
+        if Llama is None:
+            raise RuntimeError("llama-cpp-python is not installed; cannot run local inference.")
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"GGUF model not found: {model_path}")
+        self.model_path = model_path
+        self.max_tokens = max_tokens
+        self.contexts = queue.Queue()
+        # Split the cores between contexts so concurrent requests don't oversubscribe the CPU
+        n_threads = n_threads or max(1, (os.cpu_count() or 1) // pool_size)
+        # Each context memory-maps the same GGUF file, so the weights live once in the
+        # page cache and only the per-context KV cache is duplicated.
+        for _ in range(pool_size):
+            self.contexts.put(Llama(
+                model_path=model_path,
+                n_ctx=n_ctx,
+                n_threads=n_threads,
+                n_gpu_layers=0,  # CPU only
+                use_mmap=True,
+                verbose=False,
+            ))
+        # LRU of evaluated prefix states; each entry holds a full KV snapshot, so keep it small
+        self.prefix_states = OrderedDict()
+        self.max_cached_prefixes = max_cached_prefixes
+        self.prefix_lock = threading.Lock()
+        self.stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "prefix_hits": 0, "tokens": 0, "seconds": 0.0}
+        self.logger.info(f"Loaded {model_path} with {pool_size} warm context(s).")
+
+    @contextmanager
+    def acquire(self):
+        llm = self.contexts.get()
+        try:
+            yield llm
+        finally:
+            self.contexts.put(llm)
+
+    def prime_prefix(self, llm, prefix: str) -> bool:
+        # Make the context's KV cache start with the evaluated prefix; returns True on a cache
+        # hit. llama.cpp then only evaluates the tokens that follow the matching prefix.
+        with self.prefix_lock:
+            cached = self.prefix_states.get(prefix)
+            if cached is not None:
+                self.prefix_states.move_to_end(prefix)
+        if cached is not None:
+            tokens, state = cached
+            # A context that served this prefix last time still holds it; restoring the
+            # snapshot would only copy the same KV cache back in
+            if not self.holds_prefix(llm, tokens):
+                llm.load_state(state)
+            return True
+        tokens = llm.tokenize(prefix.encode("utf-8"))
+        llm.reset()
+        llm.eval(tokens)
+        state = llm.save_state()
+        with self.prefix_lock:
+            self.prefix_states[prefix] = (list(tokens), state)
+            self.prefix_states.move_to_end(prefix)
+            while len(self.prefix_states) > self.max_cached_prefixes:
+                self.prefix_states.popitem(last=False)
+        return False
+
+    @staticmethod
+    def holds_prefix(llm, tokens) -> bool:
+        return llm.n_tokens >= len(tokens) and list(llm.input_ids[:len(tokens)]) == list(tokens)
+
+    def metrics(self):
+        with self.stats_lock:
+            stats = dict(self.stats)
+        stats["tokens_per_second"] = stats["tokens"] / stats["seconds"] if stats["seconds"] > 0 else 0.0
+        with self.prefix_lock:
+            stats["cached_prefixes"] = len(self.prefix_states)
+        return stats
+
+    def generate(self, prompt: str, prefix: str = "", max_tokens: int = None):
+        with self.acquire() as llm:
+            started = time.monotonic()
+            prefix_hit = self.prime_prefix(llm, prefix) if prefix else False
+            first_token_at = None
+            pieces = []
+            for chunk in llm.create_completion(prefix + prompt, max_tokens=max_tokens or self.max_tokens,
+                                               stream=True):
+                if first_token_at is None:
+                    first_token_at = time.monotonic()
+                pieces.append(chunk["choices"][0]["text"])
+            finished = time.monotonic()
+            text = "".join(pieces)
+            # Streamed chunks are text pieces, not tokens, so count by re-tokenizing the output
+            tokens = len(llm.tokenize(text.encode("utf-8"), add_bos=False)) if text else 0
+        decode_seconds = finished - (first_token_at or finished)
+        metrics = {
+            "tokens": tokens,
+            "time_to_first_token": (first_token_at or finished) - started,
+            "tokens_per_second": tokens / decode_seconds if decode_seconds > 0 else 0.0,
+            "prefix_cache_hit": prefix_hit,
+        }
+        with self.stats_lock:
+            self.stats["requests"] += 1
+            self.stats["prefix_hits"] += int(prefix_hit)
+            self.stats["tokens"] += tokens
+            self.stats["seconds"] += finished - started
+        self.logger.info(
+            f"Generated {tokens} tokens: ttft={metrics['time_to_first_token']:.3f}s, "
+            f"{metrics['tokens_per_second']:.1f} tokens/sec, prefix cache hit={prefix_hit}"
+        )
+        return text, metrics
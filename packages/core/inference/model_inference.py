@@ -2,6 +2,8 @@ import logging
 import random
 import yaml
 
+from src.inference.local_llama import get_local_backend
+
 
 def load_model_config(config_path="config/models.yaml"):
     with open(config_path, "r") as f:
@@ -15,22 +17,42 @@ class ModelInference:
         self.config = load_model_config()
         self.active_model = self.config.get("active_model")
         self.fallback_models = self.config.get("fallback_models", [])
+        self.local_models = self.config.get("local_models") or {}
+        self.system_preamble = self.config.get("system_preamble", "")
+
+    def infer_local(self, model: str, prompt: str):
+        try:
+            backend = get_local_backend(**self.local_models[model])
+            text, metrics = backend.generate(prompt, prefix=self.system_preamble)
+        except Exception as e:
+            self.logger.error(f"Local inference with {model} failed: {str(e)}")
+            return None
+        self.logger.info(f"Local model {model} metrics: {metrics}")
+        return text
+
+    def infer_with(self, model: str, prompt: str, success_rate: float):
+        if model in self.local_models:
+            return self.infer_local(model, prompt)
+        # Simulated remote model call
+        if random.random() < success_rate:
+            return f"Inference result from {model} for prompt: {prompt}"
+        return None
 
     def infer(self, prompt: str) -> str:
         self.logger.info(f"Attempting inference with active model: {self.active_model}")
         # Simulate a potential failure with the active model
-        if random.random() < 0.5:
+        result = self.infer_with(self.active_model, prompt, 0.5)
+        if result is None:
             self.logger.error("Active model inference failed. Attempting fallback models.")
             for model in self.fallback_models:
                 self.logger.info(f"Attempting inference with fallback model: {model}")
-                if random.random() < 0.8:
-                    result = f"Inference result from {model} for prompt: {prompt}"
+                result = self.infer_with(model, prompt, 0.8)
+                if result is not None:
                     self.logger.info(result)
                     return result
             self.logger.error("All fallback models failed.")
             return "Inference failed: All models unavailable."
         else:
-            result = f"Inference result from {self.active_model} for prompt: {prompt}"
             self.logger.info(result)
             return result
 
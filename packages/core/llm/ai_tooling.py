@@ -3,6 +3,7 @@ import logging
 from src.inference.model_inference import ModelInference
 from src.memory.zept_memory import ZeptMemory
 from src.guardrails.ethical_guardrails import EthicalGuardrails
+from src.concurrency.single_flight import SingleFlight, normalize_key
 
 
 class AITooling:
@@ -11,21 +12,29 @@ class AITooling:
         self.inference_engine = ModelInference()
         self.memory = ZeptMemory()
         self.guardrails = EthicalGuardrails()
+        # Identical prompts arriving concurrently share a single inference run
+        self.single_flight = SingleFlight("AITooling")
 
-    def process_prompt(self, prompt: str) -> str:
+    def process_prompt(self, prompt: str, session_id: str = None) -> str:
+        result, redacted_result = self.single_flight.do(normalize_key(prompt), self._process_prompt, prompt)
+        if result is not None:
+            # Store the result in the caller's own memory slot so concurrent sessions don't clobber it
+            key = f"{session_id}:last_inference" if session_id else "last_inference"
+            self.memory.store_context(key, result)
+        return redacted_result
+
+    def _process_prompt(self, prompt: str):
         self.logger.info(f"Processing prompt: {prompt}")
         # Validate the prompt via ethical guardrails
         if not self.guardrails.validate_message(prompt):
             self.logger.error("Prompt failed ethical validation. Aborting processing.")
-            return "Prompt failed ethical validation."
+            return None, "Prompt failed ethical validation."
         # Perform inference using the active LLM or fallback
         result = self.inference_engine.infer(prompt)
-        # Store the result in memory for context
-        self.memory.store_context("last_inference", result)
         # Redact any PII in the inference result
         redacted_result = self.guardrails.redact_pii(result)
         self.logger.info(f"Final processed result: {redacted_result}")
-        return redacted_result
+        return result, redacted_result
 
 
 if __name__ == '__main__':
@@ -1,16 +1,31 @@
 import logging
+import threading
+from collections import OrderedDict
 
 class ZeptMemory:
-    def __init__(self):
-        self.memory = {}
+    def __init__(self, max_entries: int = 10000):
+        # Least recently used entries are evicted once max_entries is reached, so
+        # per-session keys can't grow without bound in a long-running process
+        self.memory = OrderedDict()
+        self.max_entries = max_entries
+        # Shared across request threads, so every access goes through the lock
+        self.lock = threading.Lock()
         self.logger = logging.getLogger('ZeptMemory')
 
     def store_context(self, key: str, value: str):
         self.logger.info(f"Storing context: {key} -> {value}")
-        self.memory[key] = value
+        with self.lock:
+            self.memory[key] = value
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.max_entries:
+                evicted, _ = self.memory.popitem(last=False)
+                self.logger.info(f"Evicted context: {evicted}")
 
     def retrieve_context(self, key: str):
-        value = self.memory.get(key)
+        with self.lock:
+            value = self.memory.get(key)
+            if key in self.memory:
+                self.memory.move_to_end(key)
         self.logger.info(f"Retrieving context for {key}: {value}")
         return value
 
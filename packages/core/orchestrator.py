@@ -5,9 +5,14 @@ Orchestrator for JustMaily Sprint 3 Enhancements
 This module ties together the ETL pipeline, self-healing mechanism, backup/restore simulation,
 and GPT-based remediation script generator. It provides a command-line interface to run the
 various components developed for data pipeline resilience, observability, and disaster recovery.
+
+Global --profile and --trace-memory options capture CPU and allocation profiles for the selected
+sub-command, and the bench sub-command reports latency percentiles for repeated runs.
 """
 
 import argparse
+import json
+from contextlib import ExitStack
 
 
 def run_etl():
@@ -32,27 +37,116 @@ def run_remediation():
     print(script)
 
 
-def main():
+def run_self_healing_cycle():
+    # A single health check and heal pass; self_healing.main() loops until interrupted
+    import self_healing
+    self_healing.check_pipeline_health()
+    self_healing.perform_self_healing({})
+
+
+COMMANDS = {
+    'etl': run_etl,
+    'self-healing': run_self_healing,
+    'backup': run_backup_restore,
+    'remediation': run_remediation,
+}
+
+BENCH_TARGETS = {
+    'etl': run_etl,
+    'self-healing': run_self_healing_cycle,
+    'backup': run_backup_restore,
+    'remediation': run_remediation,
+}
+
+
+def run_bench(components, iterations, warmup):
+    from src.profiling import bench
+    reports = []
+    for name in components:
+        try:
+            reports.append(bench(name, BENCH_TARGETS[name], iterations, warmup))
+        except Exception as e:
+            reports.append({'component': name, 'error': str(e)})
+    print(f"{'component':<14}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}{'mean ms':>10}")
+    for report in reports:
+        if 'error' in report:
+            print(f"{report['component']:<14}failed: {report['error']}")
+            continue
+        print(f"{report['component']:<14}" + "".join(
+            f"{report[key]:>10.1f}" for key in ('p50_ms', 'p90_ms', 'p99_ms', 'max_ms', 'mean_ms')))
+    return reports
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {value}")
+    return number
+
+
+def build_parser():
     parser = argparse.ArgumentParser(description='Orchestrator for JustMaily Sprint 3 Enhancements')
+    parser.add_argument('--profile', action='store_true',
+                        help='Capture a CPU profile (.prof and flamegraph .folded) of the sub-command')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Capture an allocation snapshot (.tracemalloc and .alloc.folded) of the sub-command')
+    parser.add_argument('--profile-dir', default='profiles', help='Directory for profiling output')
+    parser.add_argument('--top', type=positive_int, default=20, help='Number of hotspots to print in the summary')
     subparsers = parser.add_subparsers(dest='command', help='Sub-command to run')
 
     subparsers.add_parser('etl', help='Run the ETL pipeline')
     subparsers.add_parser('self-healing', help='Run the self-healing mechanism')
     subparsers.add_parser('backup', help='Run the backup and restore simulation')
     subparsers.add_parser('remediation', help='Run the GPT remediation script generator simulation')
-
-    args = parser.parse_args()
-
-    if args.command == 'etl':
-        run_etl()
-    elif args.command == 'self-healing':
-        run_self_healing()
-    elif args.command == 'backup':
-        run_backup_restore()
-    elif args.command == 'remediation':
-        run_remediation()
-    else:
+    bench_parser = subparsers.add_parser('bench', help='Run components repeatedly and report latency percentiles')
+    # Component names are validated in bench_components(): argparse rejects an empty
+    # nargs='*' list when choices= is set, which would make the "all" default unreachable
+    bench_parser.add_argument('components', nargs='*', metavar='component',
+                              help=f"Components to benchmark (default: all of {', '.join(sorted(BENCH_TARGETS))})")
+    bench_parser.add_argument('--iterations', type=positive_int, default=5, help='Timed runs per component')
+    bench_parser.add_argument('--warmup', type=non_negative_int, default=1,
+                              help='Untimed runs per component before timing')
+    bench_parser.add_argument('--json', help='Also write the latency report to this JSON file')
+    return parser
+
+
+def bench_components(parser, names):
+    unknown = [name for name in names if name not in BENCH_TARGETS]
+    if unknown:
+        parser.error(f"unknown bench component(s): {', '.join(unknown)} "
+                     f"(choose from {', '.join(sorted(BENCH_TARGETS))})")
+    return names or sorted(BENCH_TARGETS)
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command is None:
         parser.print_help()
+        return
+    if args.command == 'bench':
+        components = bench_components(parser, args.components)
+
+    with ExitStack() as stack:
+        if args.profile or args.trace_memory:
+            from src.profiling import profile_command
+            stack.enter_context(profile_command(args.command, args.profile_dir, args.top,
+                                                cpu=args.profile, memory=args.trace_memory))
+        if args.command == 'bench':
+            reports = run_bench(components, args.iterations, args.warmup)
+            if args.json:
+                with open(args.json, 'w') as f:
+                    json.dump(reports, f, indent=2)
+        else:
+            COMMANDS[args.command]()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Profiling, Memory Tracing and Benchmark Helpers for the Orchestrator CLI
+
+CPU profiles are written both as cProfile stats (<name>.prof, for snakeviz/pstats) and as
+sampled stacks in collapsed format (<name>.folded), which flamegraph.pl, speedscope and
+inferno read directly. Memory tracing writes a tracemalloc snapshot (<name>.tracemalloc)
+and allocation stacks in the same collapsed format (<name>.alloc.folded), weighted by bytes.
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+logger = logging.getLogger("Profiling")
+
+
+def frame_label(filename, lineno, name):
+    return f"{name} ({os.path.basename(filename)}:{lineno})"
+
+
+def write_folded(path, stacks):
+    with open(path, "w") as f:
+        for stack, weight in stacks.most_common():
+            f.write(f"{stack} {weight}\n")
+
+
+class StackSampler:
+    # Samples every thread, so work handed to pools (e.g. bulk-writer threads) shows up too
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            samples = []
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self.thread.ident:
+                    continue
+                labels = []
+                while frame is not None:
+                    code = frame.f_code
+                    if code is profile_command.__wrapped__.__code__:
+                        # The thread is inside the profiler's own setup or teardown
+                        labels = None
+                        break
+                    labels.append(frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                if labels is not None:
+                    labels.append(f"thread:{names.get(thread_id, thread_id)}")
+                    samples.append(";".join(reversed(labels)))
+            # Samples taken once the profiled block has returned belong to the profiler's teardown
+            if self.stopped.is_set():
+                break
+            self.stacks.update(samples)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+
+class ThreadProfilers:
+    # cProfile only sees the thread that enabled it, so every thread started while profiling
+    # gets its own profiler; their stats are merged into one pstats.Stats at the end
+    def __init__(self):
+        self.profilers = [cProfile.Profile()]
+        self.lock = threading.Lock()
+
+    def _bootstrap(self, frame, event, arg):
+        # First profile event in a new thread: hand the thread over to its own cProfile
+        profiler = cProfile.Profile()
+        with self.lock:
+            self.profilers.append(profiler)
+        profiler.enable()
+
+    def start(self):
+        threading.setprofile(self._bootstrap)
+        self.profilers[0].enable()
+
+    def stop(self):
+        self.profilers[0].disable()
+        threading.setprofile(None)
+
+    def stats(self, stream):
+        with self.lock:
+            profilers = list(self.profilers)
+        stats = pstats.Stats(profilers[0], stream=stream)
+        for profiler in profilers[1:]:
+            stats.add(profiler)
+        return stats
+
+
+def report_cpu(name, output_dir, top, profilers, sampler):
+    prof_path = os.path.join(output_dir, f"{name}.prof")
+    folded_path = os.path.join(output_dir, f"{name}.folded")
+    summary = io.StringIO()
+    stats = profilers.stats(summary)
+    stats.dump_stats(prof_path)
+    write_folded(folded_path, sampler.stacks)
+    stats.sort_stats("cumulative").print_stats(top)
+    print(f"\n=== CPU hotspots for '{name}' (top {top} by cumulative time, all threads) ===")
+    print(summary.getvalue())
+    logger.info(f"CPU profile written to {prof_path} and {folded_path}")
+
+
+def report_memory(name, output_dir, top, snapshot, current, peak):
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    snapshot_path = os.path.join(output_dir, f"{name}.tracemalloc")
+    folded_path = os.path.join(output_dir, f"{name}.alloc.folded")
+    snapshot.dump(snapshot_path)
+    stacks = Counter()
+    for stat in snapshot.statistics("traceback"):
+        # tracemalloc tracebacks are most-recent-first; collapsed stacks are root-first
+        labels = [f"{os.path.basename(f.filename)}:{f.lineno}" for f in reversed(stat.traceback)]
+        stacks[";".join(labels)] += stat.size
+    write_folded(folded_path, stacks)
+    print(f"\n=== Memory hotspots for '{name}' (current {current / 1024:.1f} KiB, "
+          f"peak {peak / 1024:.1f} KiB) ===")
+    for stat in snapshot.statistics("lineno")[:top]:
+        print(stat)
+    logger.info(f"Allocation snapshot written to {snapshot_path} and {folded_path}")
+
+
+@contextmanager
+def profile_command(name, output_dir, top=20, cpu=True, memory=False, frames=25):
+    os.makedirs(output_dir, exist_ok=True)
+    profilers = sampler = snapshot = None
+    if memory:
+        tracemalloc.start(frames)
+    if cpu:
+        profilers = ThreadProfilers()
+        sampler = StackSampler()
+        sampler.start()
+        profilers.start()
+    try:
+        yield
+    finally:
+        # Stop every collector before reporting so neither profile includes the other's output
+        if cpu:
+            sampler.stop()
+            profilers.stop()
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        if cpu:
+            report_cpu(name, output_dir, top, profilers, sampler)
+        if memory:
+            report_memory(name, output_dir, top, snapshot, current, peak)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = (len(sorted_values) - 1) * pct / 100
+    lower = int(index)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (index - lower)
+
+
+def bench(name, fn, iterations=5, warmup=1):
+    if iterations < 1:
+        raise ValueError(f"iterations must be at least 1, got {iterations}")
+    for _ in range(warmup):
+        fn()
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "component": name,
+        "iterations": iterations,
+        "min_ms": 1000 * latencies[0],
+        "p50_ms": 1000 * percentile(latencies, 50),
+        "p90_ms": 1000 * percentile(latencies, 90),
+        "p99_ms": 1000 * percentile(latencies, 99),
+        "max_ms": 1000 * latencies[-1],
+        "mean_ms": 1000 * sum(latencies) / len(latencies),
+    }
@@ -1,21 +1,48 @@
 import logging
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 class DynamicWorkflowManager:
-    def __init__(self):
+    def __init__(self, max_workers: int = 4):
         self.logger = logging.getLogger("DynamicWorkflowManager")
+        self.max_workers = max_workers
 
     def start_workflow(self, tasks):
         self.logger.info(f"Starting dynamic workflow with tasks: {tasks}")
-        results = {}
-        for task in tasks:
-            self.logger.info(f"Executing task: {task}")
-            result = self.execute_task(task)
-            results[task] = result
+        completed = {event['task']: event['result'] for event in self.stream_workflow(tasks)}
+        # Keep the results in submission order regardless of completion order
+        results = {task: completed[task] for task in tasks}
         self.logger.info(f"Workflow results: {results}")
         return results
 
+    def stream_workflow(self, tasks):
+        # Yield one event per task as soon as it finishes, in completion order
+        tasks = list(tasks)
+        total = len(tasks)
+        if not total:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, total))
+        try:
+            futures = {}
+            for task in tasks:
+                self.logger.info(f"Executing task: {task}")
+                futures[executor.submit(self.execute_task, task)] = task
+            for completed, future in enumerate(as_completed(futures), start=1):
+                yield {
+                    'task': futures[future],
+                    'result': future.result(),
+                    'completed': completed,
+                    'total': total,
+                }
+        except BaseException:
+            # The consumer went away (GeneratorExit) or something failed: drop the queued
+            # tasks instead of holding workers until the whole workflow has run
+            self.logger.info("Workflow stream closed early; cancelling pending tasks.")
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
     def execute_task(self, task):
         try:
             # Simulate task execution with a chance of failure
@@ -41,4 +68,5 @@ if __name__ == '__main__':
     logging.basicConfig(level=logging.INFO)
     workflow_manager = DynamicWorkflowManager()
     tasks = ["Task A", "Task B", "Task C"]
-    workflow_manager.start_workflow(tasks) 
\ No newline at end of file
+    for event in workflow_manager.stream_workflow(tasks):
+        logging.info(f"[{event['completed']}/{event['total']}] {event['task']}: {event['result']}")
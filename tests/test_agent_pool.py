@@ -0,0 +1,102 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.agents.orchestrator import AgentPool, Task
+
+
+def block_workers(pool, release):
+    # Hold every task on these workers until the test releases them
+    def execute_task(task):
+        release.wait(5)
+        return True
+    for agent in pool.workers:
+        agent.execute_task = execute_task
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert predicate()
+
+
+def test_dispatch_picks_least_loaded_worker():
+    release = threading.Event()
+    pool = AgentPool("Campaign Strategist", size=3)
+    block_workers(pool, release)
+    chosen = [pool.dispatch(Task(f"task {i}"))[0].name for i in range(3)]
+    release.set()
+    pool.shutdown()
+    assert sorted(chosen) == ["Campaign Strategist #1", "Campaign Strategist #2", "Campaign Strategist #3"]
+
+
+def test_concurrent_dispatch_never_doubles_up_on_one_worker():
+    # Switch threads as often as possible so an unlocked select-then-submit would race
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(20):
+            release = threading.Event()
+            pool = AgentPool("Campaign Strategist", size=16)
+            block_workers(pool, release)
+            start = threading.Barrier(16)
+
+            def dispatch(i):
+                start.wait()
+                return pool.dispatch(Task(f"task {i}"))[0].name
+
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                chosen = list(executor.map(dispatch, range(16)))
+            release.set()
+            pool.shutdown()
+            assert len(set(chosen)) == 16
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_saturated_pool_overflows_to_generalists():
+    release = threading.Event()
+    generalists = AgentPool("Generalist", size=1)
+    pool = AgentPool("Toolsmith", size=1, overflow=generalists)
+    block_workers(pool, release)
+    block_workers(generalists, release)
+    first, _ = pool.dispatch(Task("build integration"))
+    second, _ = pool.dispatch(Task("build another integration"))
+    release.set()
+    pool.shutdown()
+    generalists.shutdown()
+    assert first.name == "Toolsmith #1"
+    assert second.name == "Generalist #1"
+    assert pool.metrics()["overflowed"] == 1
+
+
+def test_metrics_report_queue_depth_and_utilization():
+    release = threading.Event()
+    pool = AgentPool("Compliance Guard", size=1)
+    block_workers(pool, release)
+    futures = [pool.dispatch(Task(f"check {i}"))[1] for i in range(3)]
+    worker = pool.workers[0]
+    wait_until(lambda: worker.metrics()["running"] == 1)
+    assert pool.metrics()["queue_depth"] == 2
+    release.set()
+    for future in futures:
+        future.result()
+    metrics = pool.metrics()
+    pool.shutdown()
+    assert metrics["queue_depth"] == 0
+    assert metrics["workers"]["Compliance Guard #1"]["completed"] == 3
+    assert 0 < metrics["utilization"] <= 1
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    test_dispatch_picks_least_loaded_worker()
+    test_concurrent_dispatch_never_doubles_up_on_one_worker()
+    test_saturated_pool_overflows_to_generalists()
+    test_metrics_report_queue_depth_and_utilization()
+    print("Agent pool tests passed")
@@ -0,0 +1,101 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import json
+import logging
+import sqlite3
+import tempfile
+import time
+
+from src.bulk_load import BulkLoader, FileSink, SQLiteSink
+
+RECORDS = [{"id": i, "value": f"RAW{i}"} for i in range(2500)]
+
+
+def test_sqlite_sink_loads_every_row_in_batches():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "load.db")
+        sink = SQLiteSink(path, pool_size=3)
+        metrics = BulkLoader(sink, batch_size=400, flush_interval=60, workers=3).load(RECORDS)
+        sink.close()
+        assert metrics["rows"] == len(RECORDS)
+        assert metrics["batches"] == 7
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute('SELECT id, value FROM "etl_records" ORDER BY id').fetchall()
+        assert rows == [(r["id"], r["value"]) for r in RECORDS]
+
+
+def test_sqlite_sink_adds_columns_instead_of_dropping_fields():
+    records = [{"id": 1, "value": "A"}, {"id": 2, "value": "B"}, {"id": 3, "value": "C", "campaign": "spring"}]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "load.db")
+        sink = SQLiteSink(path)
+        BulkLoader(sink, batch_size=2, flush_interval=60, workers=1).load(records)
+        sink.close()
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute('SELECT id, value, campaign FROM "etl_records" ORDER BY id').fetchall()
+        assert rows == [(1, "A", None), (2, "B", None), (3, "C", "spring")]
+
+
+def test_sqlite_sink_extends_an_existing_table_on_a_later_load():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "load.db")
+        first = SQLiteSink(path)
+        BulkLoader(first, flush_interval=60).load([{"id": 1, "value": "A"}])
+        first.close()
+        second = SQLiteSink(path)
+        BulkLoader(second, flush_interval=60).load([{"id": 2, "campaign": 'spring "24"', 'odd"name': 7}])
+        second.close()
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute('SELECT id, value, campaign, "odd""name" FROM "etl_records" ORDER BY id').fetchall()
+        assert rows == [(1, "A", None, None), (2, None, 'spring "24"', 7)]
+
+
+def test_sink_connections_are_reused_across_loads():
+    with tempfile.TemporaryDirectory() as tmp:
+        sink = SQLiteSink(os.path.join(tmp, "load.db"), pool_size=2)
+        # Writers return connections in completion order, so compare the set, not the order
+        pooled = {id(conn) for conn in sink.pool.connections.queue}
+        for start in (0, 1000):
+            BulkLoader(sink, batch_size=250, flush_interval=60, workers=2).load(RECORDS[start:start + 1000])
+        assert {id(conn) for conn in sink.pool.connections.queue} == pooled
+        with sink.pool.connection() as conn:
+            assert conn.execute('SELECT COUNT(*) FROM "etl_records"').fetchone() == (2000,)
+        sink.close()
+
+
+def test_file_sink_stages_one_file_per_batch():
+    with tempfile.TemporaryDirectory() as tmp:
+        metrics = BulkLoader(FileSink(tmp), batch_size=1000, flush_interval=60, workers=2).load(RECORDS)
+        files = sorted(os.listdir(tmp))
+        assert metrics["batches"] == len(files) == 3
+        staged = []
+        for name in files:
+            with open(os.path.join(tmp, name)) as f:
+                staged.extend(json.loads(line) for line in f)
+        assert sorted(staged, key=lambda r: r["id"]) == RECORDS
+
+
+def test_partial_batch_is_flushed_when_records_stop_arriving():
+    with tempfile.TemporaryDirectory() as tmp:
+        loader = BulkLoader(FileSink(tmp), batch_size=1000, flush_interval=0.1, workers=1)
+        for record in RECORDS[:10]:
+            loader.add(record)
+        deadline = time.monotonic() + 2
+        while loader.metrics()["rows"] < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Flushed by the background flusher while the loader is still open
+        assert loader.metrics()["rows"] == 10
+        assert len(os.listdir(tmp)) == 1
+        assert loader.close()["batches"] == 1
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    test_sqlite_sink_loads_every_row_in_batches()
+    test_sqlite_sink_adds_columns_instead_of_dropping_fields()
+    test_sqlite_sink_extends_an_existing_table_on_a_later_load()
+    test_sink_connections_are_reused_across_loads()
+    test_file_sink_stages_one_file_per_batch()
+    test_partial_batch_is_flushed_when_records_stop_arriving()
+    print("Bulk loader tests passed")
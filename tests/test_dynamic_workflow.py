@@ -0,0 +1,48 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import logging
+import threading
+import time
+
+from src.workflow.dynamic_workflow import DynamicWorkflowManager
+
+
+class CountingWorkflowManager(DynamicWorkflowManager):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started = []
+        self.lock = threading.Lock()
+
+    def execute_task(self, task):
+        with self.lock:
+            self.started.append(task)
+        time.sleep(0.2)
+        return f"{task} completed"
+
+
+def test_stream_yields_every_task_with_progress():
+    manager = CountingWorkflowManager(max_workers=3)
+    events = list(manager.stream_workflow([f"Task {i}" for i in range(5)]))
+    assert sorted(e['task'] for e in events) == [f"Task {i}" for i in range(5)]
+    assert [e['completed'] for e in events] == [1, 2, 3, 4, 5]
+    assert all(e['total'] == 5 for e in events)
+
+
+def test_closing_stream_cancels_pending_tasks():
+    manager = CountingWorkflowManager(max_workers=2)
+    stream = manager.stream_workflow([f"Task {i}" for i in range(8)])
+    next(stream)
+    started = time.monotonic()
+    stream.close()
+    # Only the task still running may finish; the queued ones must never start
+    assert time.monotonic() - started < 0.5
+    time.sleep(0.3)
+    assert len(manager.started) <= 4
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    test_stream_yields_every_task_with_progress()
+    test_closing_stream_cancels_pending_tasks()
+    print("Dynamic workflow tests passed")
@@ -0,0 +1,145 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import logging
+import tempfile
+from contextlib import contextmanager
+
+from src.inference import local_llama, model_inference
+from src.inference.model_inference import ModelInference
+
+
+class FakeLlama:
+    # Stands in for llama_cpp.Llama: tokens are whitespace-separated words
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.evaluated = []
+        self.loaded_states = 0
+        FakeLlama.instances.append(self)
+
+    @property
+    def input_ids(self):
+        return self.evaluated
+
+    @property
+    def n_tokens(self):
+        return len(self.evaluated)
+
+    def tokenize(self, text, add_bos=True):
+        return text.decode("utf-8").split()
+
+    def reset(self):
+        self.evaluated = []
+
+    def eval(self, tokens):
+        self.evaluated.extend(tokens)
+
+    def save_state(self):
+        return list(self.evaluated)
+
+    def load_state(self, state):
+        self.evaluated = list(state)
+        self.loaded_states += 1
+
+    def create_completion(self, prompt, max_tokens, stream):
+        # Like llama.cpp, the context ends up holding the prompt followed by the output
+        self.evaluated = self.tokenize(prompt.encode("utf-8")) + ["Fresh", "subject", "line", "glossy"]
+        # "glossy" is streamed in two pieces, so chunk count differs from token count
+        for piece in ["Fresh ", "subject ", "line ", "glo", "ssy"]:
+            yield {"choices": [{"text": piece}]}
+
+
+@contextmanager
+def fake_llama():
+    original = local_llama.Llama
+    local_llama.Llama = FakeLlama
+    FakeLlama.instances = []
+    try:
+        with tempfile.NamedTemporaryFile(suffix=".gguf") as model:
+            yield model.name
+    finally:
+        local_llama.Llama = original
+
+
+def test_backend_is_loaded_once_and_contexts_are_reused():
+    with fake_llama() as model_path:
+        backend = local_llama.get_local_backend(model_path, pool_size=2)
+        assert local_llama.get_local_backend(model_path, pool_size=2) is backend
+        for i in range(5):
+            backend.generate(f"Prompt {i}")
+        assert len(FakeLlama.instances) == 2
+        assert all(llm.kwargs["n_gpu_layers"] == 0 and llm.kwargs["use_mmap"] for llm in FakeLlama.instances)
+
+
+def test_second_call_hits_prefix_cache_and_counts_tokens():
+    with fake_llama() as model_path:
+        backend = local_llama.LocalLlamaBackend(model_path, pool_size=1)
+        _, first = backend.generate("Write a subject line", prefix="Follow the guardrails. ")
+        text, second = backend.generate("Write another one", prefix="Follow the guardrails. ")
+        assert not first["prefix_cache_hit"]
+        assert second["prefix_cache_hit"]
+        # The context still held the prefix from the first call, so no snapshot was restored
+        assert FakeLlama.instances[0].loaded_states == 0
+        assert text == "Fresh subject line glossy"
+        assert second["tokens"] == 4
+        metrics = backend.metrics()
+        assert metrics["requests"] == 2 and metrics["prefix_hits"] == 1 and metrics["tokens"] == 8
+
+
+def test_prefix_snapshot_is_restored_when_context_moved_on():
+    with fake_llama() as model_path:
+        backend = local_llama.LocalLlamaBackend(model_path, pool_size=1)
+        backend.generate("Write a subject line", prefix="Follow the guardrails. ")
+        backend.generate("Write a subject line", prefix="Tenant specific preamble. ")
+        _, metrics = backend.generate("Write another one", prefix="Follow the guardrails. ")
+        assert metrics["prefix_cache_hit"]
+        assert FakeLlama.instances[0].loaded_states == 1
+
+
+def test_threads_are_split_between_pooled_contexts():
+    with fake_llama() as model_path:
+        local_llama.LocalLlamaBackend(model_path, pool_size=2)
+        expected = max(1, (os.cpu_count() or 1) // 2)
+        assert [llm.kwargs["n_threads"] for llm in FakeLlama.instances] == [expected, expected]
+
+
+def test_prefix_cache_is_bounded():
+    with fake_llama() as model_path:
+        backend = local_llama.LocalLlamaBackend(model_path, pool_size=1, max_cached_prefixes=2)
+        for tenant in ("a", "b", "c"):
+            backend.generate("Prompt", prefix=f"Preamble for tenant {tenant} ")
+        assert list(backend.prefix_states) == ["Preamble for tenant b ", "Preamble for tenant c "]
+
+
+class CrashingLlama(FakeLlama):
+    def create_completion(self, prompt, max_tokens, stream):
+        raise RuntimeError("llama_decode returned -1")
+
+
+def test_failing_local_backend_falls_back_to_next_model():
+    inference = ModelInference()
+    inference.active_model = "local-llama"
+    inference.fallback_models = ["claude-3-5-sonnet"]
+    original_random = model_inference.random.random
+    model_inference.random.random = lambda: 0.0
+    try:
+        with fake_llama() as model_path:
+            local_llama.Llama = CrashingLlama
+            inference.local_models = {"local-llama": {"model_path": model_path}}
+            assert inference.infer_with("local-llama", "Prompt", 1.0) is None
+            assert inference.infer("Prompt") == "Inference result from claude-3-5-sonnet for prompt: Prompt"
+    finally:
+        model_inference.random.random = original_random
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    test_backend_is_loaded_once_and_contexts_are_reused()
+    test_second_call_hits_prefix_cache_and_counts_tokens()
+    test_prefix_snapshot_is_restored_when_context_moved_on()
+    test_threads_are_split_between_pooled_contexts()
+    test_prefix_cache_is_bounded()
+    test_failing_local_backend_falls_back_to_next_model()
+    print("Local llama backend tests passed")
@@ -0,0 +1,105 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.ai_orchestration.core import AIAgentOrchestrationCore
+from src.llm.ai_tooling import AITooling
+from src.memory.zept_memory import ZeptMemory
+from src.workflow.dynamic_workflow import DynamicWorkflowManager
+
+CONCURRENT_RUNS = 48
+
+
+class JitteryWorkflowManager(DynamicWorkflowManager):
+    # Short random delays instead of the simulated 1s work, to interleave runs as much as possible
+    def execute_task(self, task):
+        time.sleep(random.uniform(0, 0.01))
+        return f"{task} completed"
+
+
+def test_concurrent_orchestrations_do_not_cross_talk():
+    core = AIAgentOrchestrationCore()
+    core.workflow_manager = JitteryWorkflowManager()
+    goals = [f"Campaign goal {i}" for i in range(CONCURRENT_RUNS)]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(core.orchestrate, goals))
+
+    assert len({r['session_id'] for r in results}) == CONCURRENT_RUNS
+    for goal, result in zip(goals, results):
+        assert len(result['static_results']) == 3
+        for task, output in result['static_results'].items():
+            assert task.endswith(goal) and output.startswith(task)
+        for task, output in result['dynamic_results'].items():
+            assert task in result['static_results'].values() and output == f"{task} completed"
+
+
+class EchoInference:
+    # Deterministic stand-in for the simulated models; the output carries PII so that
+    # the stored (raw) and returned (redacted) values differ. Blocks until released so
+    # identical prompts are coalesced by the single-flight layer.
+    def __init__(self):
+        self.release = threading.Event()
+
+    def infer(self, prompt):
+        self.release.wait(5)
+        return f"Result for {prompt}, reply to owner@example.com"
+
+
+def run_prompts(ai_tooling, sessions, followers=0):
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {session_id: executor.submit(ai_tooling.process_prompt, prompt, session_id=session_id)
+                   for session_id, prompt in sessions.items()}
+        deadline = time.monotonic() + 2
+        while ai_tooling.single_flight.stats()["coalesced"] < followers and time.monotonic() < deadline:
+            time.sleep(0.005)
+        ai_tooling.inference_engine.release.set()
+        return {session_id: future.result() for session_id, future in futures.items()}
+
+
+def test_concurrent_prompts_keep_session_memory_isolated():
+    ai_tooling = AITooling()
+    ai_tooling.inference_engine = EchoInference()
+    sessions = {f"session-{i}": f"Draft subject line variant {i}" for i in range(CONCURRENT_RUNS)}
+    outputs = run_prompts(ai_tooling, sessions)
+
+    for session_id, prompt in sessions.items():
+        stored = ai_tooling.memory.retrieve_context(f"{session_id}:last_inference")
+        assert stored == f"Result for {prompt}, reply to owner@example.com"
+        assert outputs[session_id] == f"Result for {prompt}, reply to [REDACTED_EMAIL]"
+
+
+def test_sessions_sharing_a_prompt_each_get_their_own_memory_entry():
+    ai_tooling = AITooling()
+    ai_tooling.inference_engine = EchoInference()
+    prompt = "Draft the spring launch subject line"
+    sessions = {f"session-{i}": prompt for i in range(8)}
+    outputs = run_prompts(ai_tooling, sessions, followers=len(sessions) - 1)
+
+    assert ai_tooling.single_flight.stats()["executions"] == 1
+    for session_id in sessions:
+        stored = ai_tooling.memory.retrieve_context(f"{session_id}:last_inference")
+        assert stored == f"Result for {prompt}, reply to owner@example.com"
+        assert outputs[session_id] == f"Result for {prompt}, reply to [REDACTED_EMAIL]"
+
+
+def test_session_memory_evicts_least_recently_used_entries():
+    memory = ZeptMemory(max_entries=3)
+    for i in range(3):
+        memory.store_context(f"session-{i}:last_inference", f"result {i}")
+    memory.retrieve_context("session-0:last_inference")
+    memory.store_context("session-3:last_inference", "result 3")
+    assert list(memory.memory) == [f"session-{i}:last_inference" for i in (2, 0, 3)]
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING)
+    test_concurrent_orchestrations_do_not_cross_talk()
+    test_concurrent_prompts_keep_session_memory_isolated()
+    test_sessions_sharing_a_prompt_each_get_their_own_memory_entry()
+    test_session_memory_evicts_least_recently_used_entries()
+    print(f"{CONCURRENT_RUNS} concurrent orchestrations completed without cross-talk")
@@ -0,0 +1,38 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+
+from src.orchestrator import BENCH_TARGETS, bench_components, build_parser
+
+
+def test_bench_without_components_runs_every_component():
+    parser = build_parser()
+    args = parser.parse_args(['bench'])
+    assert args.components == []
+    assert bench_components(parser, args.components) == sorted(BENCH_TARGETS)
+
+
+def test_bench_accepts_selected_components():
+    parser = build_parser()
+    args = parser.parse_args(['bench', 'etl', 'backup', '--iterations', '3'])
+    assert bench_components(parser, args.components) == ['etl', 'backup']
+    assert args.iterations == 3
+
+
+def test_bench_rejects_unknown_components():
+    parser = build_parser()
+    args = parser.parse_args(['bench', 'etl', 'nightly-export'])
+    with pytest.raises(SystemExit):
+        bench_components(parser, args.components)
+
+
+@pytest.mark.parametrize('argv', [
+    ['bench', '--iterations', '0'],
+    ['bench', '--iterations', '-2'],
+    ['bench', '--warmup', '-1'],
+    ['--top', '0', 'etl'],
+])
+def test_parser_rejects_out_of_range_counts(argv):
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(argv)
@@ -0,0 +1,91 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pstats
+import re
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src import profiling
+from src.profiling import bench, percentile, profile_command
+
+FOLDED_LINE = re.compile(r"^\S.* \d+$")
+
+
+def busy_worker(n):
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def allocate_and_fan_out():
+    blobs = [bytearray(1024) for _ in range(2000)]
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="profiled-worker") as executor:
+        list(executor.map(busy_worker, [60000] * 4))
+    return blobs
+
+
+def read_folded(path):
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert lines
+    assert all(FOLDED_LINE.match(line) for line in lines)
+    return lines
+
+
+def test_profile_command_writes_cpu_and_memory_profiles(tmp_path, capsys):
+    with profile_command("unit", str(tmp_path), top=3, cpu=True, memory=True):
+        allocate_and_fan_out()
+
+    assert sorted(os.listdir(tmp_path)) == ["unit.alloc.folded", "unit.folded", "unit.prof", "unit.tracemalloc"]
+
+    stacks = read_folded(tmp_path / "unit.folded")
+    assert any(line.startswith("thread:profiled-worker") and "busy_worker" in line for line in stacks)
+    assert not any("profile_command (profiling.py" in line or "stack-sampler" in line for line in stacks)
+
+    # Worker threads are profiled too, not just the thread that entered profile_command
+    functions = {name for _, _, name in pstats.Stats(str(tmp_path / "unit.prof")).stats}
+    assert {"allocate_and_fan_out", "busy_worker"} <= functions
+
+    read_folded(tmp_path / "unit.alloc.folded")
+    snapshot = tracemalloc.Snapshot.load(str(tmp_path / "unit.tracemalloc"))
+    assert snapshot.statistics("lineno")
+
+    output = capsys.readouterr().out
+    assert "=== CPU hotspots for 'unit' (top 3" in output
+    assert "due to restriction <3>" in output
+    assert "=== Memory hotspots for 'unit'" in output
+    assert threading.getprofile() is None
+
+
+def test_percentile_interpolates_between_samples():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 90) == pytest.approx(4.6)
+    assert percentile(values, 99) == pytest.approx(4.96)
+    assert percentile([], 50) == 0.0
+
+
+def test_bench_reports_latency_percentiles(monkeypatch):
+    # Iterations take 1..5 ms according to a scripted clock
+    ticks = iter([t for i in range(5) for t in (10.0 * i, 10.0 * i + (5 - i) / 1000)])
+    monkeypatch.setattr(profiling.time, "perf_counter", lambda: next(ticks))
+    calls = []
+    report = bench("unit", lambda: calls.append(1), iterations=5, warmup=2)
+    assert len(calls) == 7
+    assert report["iterations"] == 5
+    assert report["min_ms"] == pytest.approx(1.0)
+    assert report["p50_ms"] == pytest.approx(3.0)
+    assert report["p90_ms"] == pytest.approx(4.6)
+    assert report["p99_ms"] == pytest.approx(4.96)
+    assert report["max_ms"] == pytest.approx(5.0)
+    assert report["mean_ms"] == pytest.approx(3.0)
+
+
+def test_bench_rejects_zero_iterations():
+    with pytest.raises(ValueError):
+        bench("unit", lambda: None, iterations=0)
@@ -0,0 +1,123 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.concurrency.single_flight import SingleFlight, SingleFlightAborted, normalize_key
+
+
+class BlockingCall:
+    # A computation that signals when it starts and runs until the test releases it
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.entered.set()
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def wait_for_waiters(flight, count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while flight.stats()["coalesced"] < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def run_concurrently(flight, key, fn, followers):
+    # Start the leader, then the followers once the leader's computation is in flight
+    def call():
+        try:
+            return flight.do(key, fn)
+        except BaseException as e:
+            return e
+    executor = ThreadPoolExecutor(max_workers=followers + 1)
+    futures = [executor.submit(call)]
+    fn.entered.wait(2)
+    futures += [executor.submit(call) for _ in range(followers)]
+    wait_for_waiters(flight, followers)
+    fn.release.set()
+    results = [f.result() for f in futures]
+    executor.shutdown()
+    return results
+
+
+def test_followers_share_the_leader_result():
+    flight = SingleFlight("test")
+    fn = BlockingCall(result="campaign plan")
+    results = run_concurrently(flight, "goal", fn, followers=5)
+    assert results == ["campaign plan"] * 6
+    assert fn.calls == 1
+
+
+def test_leader_error_is_raised_to_every_follower():
+    flight = SingleFlight("test")
+    error = ValueError("inference backend down")
+    results = run_concurrently(flight, "goal", BlockingCall(error=error), followers=3)
+    assert all(result is error for result in results)
+
+
+def test_aborted_leader_gives_followers_an_error_not_none():
+    flight = SingleFlight("test")
+    results = run_concurrently(flight, "goal", BlockingCall(error=KeyboardInterrupt()), followers=3)
+    leader, followers = results[0], results[1:]
+    assert isinstance(leader, KeyboardInterrupt)
+    assert all(isinstance(result, SingleFlightAborted) for result in followers)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_key_is_released_after_an_error():
+    flight = SingleFlight("test")
+    run_concurrently(flight, "goal", BlockingCall(error=ValueError("boom")), followers=1)
+    assert flight.stats()["in_flight"] == 0
+    assert flight.do("goal", lambda: "recovered") == "recovered"
+
+
+def test_stale_follower_times_out():
+    flight = SingleFlight("test", timeout=0.05)
+    fn = BlockingCall(result="late")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(flight.do, "goal", fn)
+        fn.entered.wait(2)
+        try:
+            flight.do("goal", fn)
+            raise AssertionError("follower should have timed out")
+        except TimeoutError:
+            pass
+        fn.release.set()
+        assert leader.result() == "late"
+    assert flight.stats()["timeouts"] == 1
+
+
+def test_stats_count_requests_executions_and_coalesced():
+    flight = SingleFlight("test")
+    run_concurrently(flight, "goal", BlockingCall(result="ok"), followers=4)
+    run_concurrently(flight, "other", BlockingCall(error=ValueError("boom")), followers=2)
+    assert flight.stats() == {"requests": 8, "executions": 2, "coalesced": 6, "errors": 1,
+                              "timeouts": 0, "in_flight": 0}
+
+
+def test_keys_only_ignore_outer_whitespace():
+    assert normalize_key("  Draft ACME subject \n") == "Draft ACME subject"
+    assert normalize_key("Draft ACME subject") != normalize_key("draft acme subject")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    test_followers_share_the_leader_result()
+    test_leader_error_is_raised_to_every_follower()
+    test_aborted_leader_gives_followers_an_error_not_none()
+    test_key_is_released_after_an_error()
+    test_stale_follower_times_out()
+    test_stats_count_requests_executions_and_coalesced()
+    test_keys_only_ignore_outer_whitespace()
+    print("Single-flight tests passed")